@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db import transaction
+from .cache import invalidate_activity_cache
 from .models import Activity
 
 
@@ -13,7 +15,7 @@ class ActivityAdmin(admin.ModelAdmin):
     )
     list_filter = (
         'activity_type', 'intensity', 'date', 'created_at',
-        'user__username'
+        ('user', admin.RelatedOnlyFieldListFilter)
     )
     search_fields = (
         'title', 'description', 'user__username', 'user__email',
@@ -62,18 +64,62 @@ class ActivityAdmin(admin.ModelAdmin):
     # Custom admin actions
     actions = ['duplicate_activity']
     
+    @admin.action(
+        description="Duplicate selected activities",
+        permissions=['add']
+    )
     def duplicate_activity(self, request, queryset):
         """
-        Duplicate selected activities
+        Duplicate selected activities, streaming the selection and inserting
+        the copies in batches so memory stays bounded
         """
-        for activity in queryset:
-            activity.pk = None
-            activity.title = f"{activity.title} (Copy)"
-            activity.save()
+        batch_size = 500
+        created = 0
+        batch = []
+        user_ids = set()
+        activities = queryset.select_related(None).defer(
+            'pace', 'speed', 'created_at', 'updated_at'
+        )
+        
+        with transaction.atomic():
+            for activity in activities.iterator(chunk_size=batch_size):
+                copy = Activity(
+                    user_id=activity.user_id,
+                    activity_type=activity.activity_type,
+                    title=f"{activity.title} (Copy)",
+                    description=activity.description,
+                    duration=activity.duration,
+                    distance=activity.distance,
+                    calories_burned=activity.calories_burned,
+                    intensity=activity.intensity,
+                    date=activity.date,
+                    start_time=activity.start_time,
+                    average_heart_rate=activity.average_heart_rate,
+                    max_heart_rate=activity.max_heart_rate,
+                    elevation_gain=activity.elevation_gain,
+                    location=activity.location,
+                )
+                copy.populate_derived_fields()
+                batch.append(copy)
+                user_ids.add(activity.user_id)
+                if len(batch) >= batch_size:
+                    Activity.objects.bulk_create(batch)
+                    created += len(batch)
+                    batch = []
+            
+            if batch:
+                Activity.objects.bulk_create(batch)
+                created += len(batch)
+            
+            # bulk_create sends no signals, so refresh the owners' cached
+            # activity responses once the copies are visible
+            def invalidate_caches():
+                for user_id in user_ids:
+                    invalidate_activity_cache(user_id)
+            
+            transaction.on_commit(invalidate_caches)
         
         self.message_user(
             request,
-            f"{queryset.count()} activities duplicated successfully."
+            f"{created} activities duplicated successfully."
         )
-    
-    duplicate_activity.short_description = "Duplicate selected activities"
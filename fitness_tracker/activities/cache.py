@@ -0,0 +1,25 @@
+import time
+from django.core.cache import cache
+
+
+# Seconds that read-only activity responses stay cached
+ACTIVITY_CACHE_TIMEOUT = 60
+
+
+def activity_cache_key(request):
+    """
+    Build a per-user cache key for a read-only activity response
+    
+    The key embeds the user's current cache version, so bumping the
+    version invalidates every cached response for that user at once.
+    """
+    user_id = request.user.id
+    version = cache.get_or_set(f"act:{user_id}:version", time.time_ns, None)
+    return f"act:{user_id}:v{version}:{request.get_full_path()}"
+
+
+def invalidate_activity_cache(user_id):
+    """
+    Invalidate all cached activity responses for a user
+    """
+    cache.set(f"act:{user_id}:version", time.time_ns(), None)
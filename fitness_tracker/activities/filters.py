@@ -1,4 +1,5 @@
 import django_filters
+from django.db.models import Q
 from .models import Activity
 
 
@@ -36,9 +37,13 @@ class ActivityFilter(django_filters.FilterSet):
     def filter_search(self, queryset, name, value):
         """
         Custom search filter for title, description, and location
+        
+        On PostgreSQL icontains compiles to UPPER(col::text) LIKE UPPER(%s),
+        which the activity_search_trgm index is built on, so these lookups
+        use it instead of a sequential scan.
         """
         return queryset.filter(
-            models.Q(title__icontains=value) |
-            models.Q(description__icontains=value) |
-            models.Q(location__icontains=value)
-        )
\ No newline at end of file
+            Q(title__icontains=value) |
+            Q(description__icontains=value) |
+            Q(location__icontains=value)
+        )
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.9 on 2026-10-15 17:17
+
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Activity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activity_type', models.CharField(choices=[('RUNNING', 'Running'), ('CYCLING', 'Cycling'), ('SWIMMING', 'Swimming'), ('WALKING', 'Walking'), ('WEIGHTLIFTING', 'Weightlifting'), ('YOGA', 'Yoga'), ('HIIT', 'HIIT'), ('CROSSFIT', 'CrossFit'), ('BOXING', 'Boxing'), ('ROWING', 'Rowing'), ('PILATES', 'Pilates'), ('DANCING', 'Dancing'), ('HIKING', 'Hiking'), ('BASKETBALL', 'Basketball'), ('FOOTBALL', 'Football'), ('TENNIS', 'Tennis'), ('GOLF', 'Golf'), ('OTHER', 'Other')], help_text='Type of fitness activity', max_length=20)),
+                ('title', models.CharField(blank=True, help_text='Optional title for the activity', max_length=200)),
+                ('description', models.TextField(blank=True, help_text='Optional description or notes about the activity')),
+                ('duration', models.PositiveIntegerField(help_text='Duration in minutes', validators=[django.core.validators.MinValueValidator(1)])),
+                ('distance', models.DecimalField(blank=True, decimal_places=2, help_text='Distance covered in kilometers', max_digits=6, null=True, validators=[django.core.validators.MinValueValidator(0)])),
+                ('calories_burned', models.PositiveIntegerField(blank=True, help_text='Estimated calories burned', null=True, validators=[django.core.validators.MinValueValidator(0)])),
+                ('intensity', models.CharField(choices=[('LOW', 'Low'), ('MODERATE', 'Moderate'), ('HIGH', 'High'), ('EXTREME', 'Extreme')], default='MODERATE', help_text='Intensity level of the activity', max_length=10)),
+                ('date', models.DateField(default=django.utils.timezone.now, help_text='Date when the activity was performed')),
+                ('start_time', models.TimeField(blank=True, help_text='Start time of the activity', null=True)),
+                ('average_heart_rate', models.PositiveIntegerField(blank=True, help_text='Average heart rate in BPM', null=True, validators=[django.core.validators.MinValueValidator(30), django.core.validators.MaxValueValidator(220)])),
+                ('max_heart_rate', models.PositiveIntegerField(blank=True, help_text='Maximum heart rate in BPM', null=True, validators=[django.core.validators.MinValueValidator(30), django.core.validators.MaxValueValidator(220)])),
+                ('elevation_gain', models.DecimalField(blank=True, decimal_places=2, help_text='Elevation gain in meters', max_digits=6, null=True, validators=[django.core.validators.MinValueValidator(0)])),
+                ('location', models.CharField(blank=True, help_text='Location where the activity took place', max_length=200)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(help_text='User who logged this activity', on_delete=django.db.models.deletion.CASCADE, related_name='activities', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Activities',
+                'db_table': 'activities',
+                'ordering': ['-date', '-created_at'],
+                'indexes': [models.Index(fields=['user', '-date'], name='activities_user_id_5cc191_idx'), models.Index(fields=['activity_type'], name='activities_activit_f14342_idx'), models.Index(fields=['-created_at'], name='activities_created_765ec9_idx')],
+            },
+        ),
+    ]
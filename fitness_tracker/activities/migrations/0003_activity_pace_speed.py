@@ -0,0 +1,44 @@
+# Generated by Django 4.2.9 on 2026-10-15 17:20
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def populate_pace_speed(apps, schema_editor):
+    """
+    Backfill the stored pace/speed columns for existing activities
+    """
+    Activity = apps.get_model('activities', 'Activity')
+    batch = []
+    for activity in Activity.objects.filter(distance__gt=0).iterator(chunk_size=500):
+        activity.pace = (Decimal(activity.duration) / activity.distance).quantize(Decimal('0.01'))
+        if activity.duration > 0:
+            activity.speed = (activity.distance * 60 / activity.duration).quantize(Decimal('0.01'))
+        batch.append(activity)
+        if len(batch) >= 500:
+            Activity.objects.bulk_update(batch, ['pace', 'speed'])
+            batch = []
+    if batch:
+        Activity.objects.bulk_update(batch, ['pace', 'speed'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activities', '0002_activity_search_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activity',
+            name='pace',
+            field=models.DecimalField(decimal_places=2, editable=False, help_text='Pace in minutes per kilometer (computed on save)', max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='speed',
+            field=models.DecimalField(decimal_places=2, editable=False, help_text='Average speed in km/h (computed on save)', max_digits=12, null=True),
+        ),
+        migrations.RunPython(populate_pace_speed, migrations.RunPython.noop),
+    ]
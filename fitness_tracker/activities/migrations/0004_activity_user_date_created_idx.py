@@ -0,0 +1,21 @@
+# Generated by Django 4.2.9 on 2026-10-15 17:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activities', '0003_activity_pace_speed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['user', '-date', '-created_at'], name='act_user_date_created_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='activity',
+            name='activities_user_id_5cc191_idx',
+        ),
+    ]
@@ -0,0 +1,47 @@
+import datetime
+
+from django.db import migrations
+
+
+def add_date_check(apps, schema_editor):
+    """
+    Reject activity dates in the future at the database level, allowing a
+    day of slack for clients ahead of UTC (PostgreSQL only; SQLite does not
+    allow CURRENT_DATE in CHECK constraints)
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # NOT VALID enforces the check on new and updated rows without failing
+    # on future-dated rows saved before the API rejected them
+    schema_editor.execute(
+        "ALTER TABLE activities ADD CONSTRAINT activity_date_not_future "
+        "CHECK (date <= CURRENT_DATE + 1) NOT VALID"
+    )
+    
+    # Validate straight away when existing data allows it; otherwise run
+    # VALIDATE CONSTRAINT once those rows have been corrected
+    Activity = apps.get_model('activities', 'Activity')
+    cutoff = datetime.date.today() + datetime.timedelta(days=1)
+    if not Activity.objects.using(schema_editor.connection.alias).filter(date__gt=cutoff).exists():
+        schema_editor.execute(
+            "ALTER TABLE activities VALIDATE CONSTRAINT activity_date_not_future"
+        )
+
+
+def drop_date_check(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        "ALTER TABLE activities DROP CONSTRAINT IF EXISTS activity_date_not_future"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activities', '0004_activity_user_date_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_date_check, drop_date_check),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Rebuild the trigram index on UPPER(col::text), the form Django compiles
+    icontains to on PostgreSQL (UPPER(col::text) LIKE UPPER('%term%')), so
+    the planner can use it for search (PostgreSQL only)
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS activity_search_trgm")
+    schema_editor.execute(
+        "CREATE INDEX activity_search_trgm ON activities USING gin ("
+        "UPPER(title::text) gin_trgm_ops, UPPER(description::text) gin_trgm_ops, "
+        "UPPER(location::text) gin_trgm_ops)"
+    )
+
+
+def restore_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS activity_search_trgm")
+    schema_editor.execute(
+        "CREATE INDEX activity_search_trgm ON activities "
+        "USING gin (title gin_trgm_ops, description gin_trgm_ops, location gin_trgm_ops)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activities', '0005_activity_date_not_future'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, restore_search_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.9 on 2026-10-15 17:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activities', '0006_activity_search_trgm_upper'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activity',
+            name='pace',
+            field=models.DecimalField(decimal_places=2, editable=False, help_text='Pace in minutes per kilometer (computed on save)', max_digits=14, null=True),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.9 on 2026-10-15 18:07
+
+import activities.models
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activities', '0007_activity_pace_max_digits'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activity',
+            name='date',
+            field=models.DateField(default=django.utils.timezone.now, help_text='Date when the activity was performed', validators=[activities.models.validate_not_future]),
+        ),
+    ]
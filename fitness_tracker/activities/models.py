@@ -1,7 +1,18 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from decimal import Decimal
+
+
+def validate_not_future(value):
+    """
+    Reject activity dates in the future, so forms and serializers report
+    an error instead of hitting the activity_date_not_future constraint
+    """
+    if value > timezone.now().date():
+        raise ValidationError("Activity date cannot be in the future.", code='future_date')
 
 
 class Activity(models.Model):
@@ -30,6 +41,8 @@ class Activity(models.Model):
         ('OTHER', 'Other'),
     ]
     
+    ACTIVITY_TYPE_LABELS = dict(ACTIVITY_TYPE_CHOICES)
+    
     INTENSITY_CHOICES = [
         ('LOW', 'Low'),
         ('MODERATE', 'Moderate'),
@@ -91,7 +104,8 @@ class Activity(models.Model):
     
     date = models.DateField(
         default=timezone.now,
-        help_text="Date when the activity was performed"
+        help_text="Date when the activity was performed",
+        validators=[validate_not_future]
     )
     
     start_time = models.TimeField(
@@ -129,6 +143,24 @@ class Activity(models.Model):
         help_text="Location where the activity took place"
     )
     
+    # Sized for the worst case: the largest duration (2**31 - 1 minutes)
+    # over the smallest distance (0.01 km)
+    pace = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        null=True,
+        editable=False,
+        help_text="Pace in minutes per kilometer (computed on save)"
+    )
+    
+    speed = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        editable=False,
+        help_text="Average speed in km/h (computed on save)"
+    )
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -137,37 +169,55 @@ class Activity(models.Model):
         ordering = ['-date', '-created_at']
         verbose_name_plural = 'Activities'
         indexes = [
-            models.Index(fields=['user', '-date']),
+            models.Index(fields=['user', '-date', '-created_at'], name='act_user_date_created_idx'),
             models.Index(fields=['activity_type']),
             models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
-        return f"{self.user.username} - {self.get_activity_type_display()} on {self.date}"
+        return f"{self.user.username} - {self.activity_type_label} on {self.date}"
     
     @property
-    def pace(self):
+    def activity_type_label(self):
+        """
+        Display label for the activity type, looked up in a prebuilt map
+        """
+        return self.ACTIVITY_TYPE_LABELS.get(self.activity_type, self.activity_type)
+    
+    def calculate_pace(self):
         """
         Calculate pace (minutes per kilometer) for distance-based activities
         """
         if self.distance and self.distance > 0:
-            return round(self.duration / float(self.distance), 2)
+            return (Decimal(self.duration) / Decimal(self.distance)).quantize(Decimal('0.01'))
         return None
     
-    @property
-    def speed(self):
+    def calculate_speed(self):
         """
         Calculate average speed (km/h) for distance-based activities
         """
         if self.distance and self.duration > 0:
-            hours = self.duration / 60
-            return round(float(self.distance) / hours, 2)
+            return (Decimal(self.distance) * 60 / self.duration).quantize(Decimal('0.01'))
         return None
     
-    def save(self, *args, **kwargs):
+    def populate_derived_fields(self):
         """
-        Auto-generate title if not provided
+        Fill in the auto-generated title and stored pace/speed
+        
+        Called by save(); bulk paths that bypass save() (bulk_create) call
+        it directly so their rows match.
         """
         if not self.title:
-            self.title = f"{self.get_activity_type_display()} - {self.date}"
-        super().save(*args, **kwargs)
\ No newline at end of file
+            self.title = f"{self.activity_type_label} - {self.date}"
+        self.pace = self.calculate_pace()
+        self.speed = self.calculate_speed()
+    
+    def save(self, *args, **kwargs):
+        """
+        Populate derived fields before saving
+        """
+        self.populate_derived_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'pace', 'speed'}
+        super().save(*args, **kwargs)
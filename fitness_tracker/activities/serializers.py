@@ -3,16 +3,19 @@ from .models import Activity
 from django.contrib.auth.models import User
 
 
+# Choice labels resolved once at import time for display fields
+_ACTIVITY_TYPE_MAP = Activity.ACTIVITY_TYPE_LABELS
+_INTENSITY_MAP = dict(Activity.INTENSITY_CHOICES)
+
+
 class ActivitySerializer(serializers.ModelSerializer):
     """
     Main serializer for Activity model
     """
-    user = serializers.StringRelatedField(read_only=True)
+    user = serializers.CharField(source='user.username', read_only=True)
     user_id = serializers.PrimaryKeyRelatedField(read_only=True, source='user')
-    activity_type_display = serializers.CharField(source='get_activity_type_display', read_only=True)
-    intensity_display = serializers.CharField(source='get_intensity_display', read_only=True)
-    pace = serializers.ReadOnlyField()
-    speed = serializers.ReadOnlyField()
+    activity_type_display = serializers.SerializerMethodField()
+    intensity_display = serializers.SerializerMethodField()
     
     class Meta:
         model = Activity
@@ -25,14 +28,78 @@ class ActivitySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'user']
     
-    def validate_date(self, value):
+    def __init__(self, *args, **kwargs):
+        """
+        Accept an optional `fields` argument restricting the output fields
+        """
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+    
+    @classmethod
+    def parse_fields(cls, value):
+        """
+        Parse a comma-separated `?fields=` value into known field names
+        """
+        if not value:
+            return None
+        fields = [name for name in value.split(',') if name in cls.Meta.fields]
+        return fields or None
+    
+    # Keys in .values() rows for fields that are not read from a same-named column
+    VALUES_KEYS = {
+        'user': 'user__username',
+        'activity_type_display': 'activity_type',
+        'intensity_display': 'intensity',
+    }
+    
+    def get_values_keys(self):
+        """
+        Return the .values() keys needed to represent the current fields
+        """
+        return sorted({self.VALUES_KEYS.get(name, name) for name in self.fields})
+    
+    def to_representation_rows(self, rows):
         """
-        Validate that activity date is not in the future
+        Represent dict rows from .values() without building model instances
+        
+        Each value is formatted by the same bound field that would handle the
+        model attribute, so the output matches to_representation().
         """
-        from django.utils import timezone
-        if value > timezone.now().date():
-            raise serializers.ValidationError("Activity date cannot be in the future.")
-        return value
+        display_maps = {
+            'activity_type_display': _ACTIVITY_TYPE_MAP,
+            'intensity_display': _INTENSITY_MAP,
+        }
+        plan = []
+        for name, field in self.fields.items():
+            key = self.VALUES_KEYS.get(name, name)
+            if name in display_maps:
+                labels = display_maps[name]
+                plan.append((name, key, lambda value, labels=labels: labels.get(value, value)))
+            elif name == 'user_id':
+                plan.append((name, key, None))
+            else:
+                plan.append((name, key, field.to_representation))
+        
+        data = []
+        for row in rows:
+            item = {}
+            for name, key, represent in plan:
+                value = row[key]
+                if value is None or represent is None:
+                    item[name] = value
+                else:
+                    item[name] = represent(value)
+            data.append(item)
+        return data
+    
+    def get_activity_type_display(self, obj):
+        return _ACTIVITY_TYPE_MAP.get(obj.activity_type, obj.activity_type)
+    
+    def get_intensity_display(self, obj):
+        return _INTENSITY_MAP.get(obj.intensity, obj.intensity)
     
     def validate(self, attrs):
         """
@@ -66,8 +133,8 @@ class ActivityCreateSerializer(serializers.ModelSerializer):
         """
         Create activity with current user
         """
-        user = self.context['request'].user
-        return Activity.objects.create(user=user, **validated_data)
+        validated_data.setdefault('user', self.context['request'].user)
+        return Activity.objects.create(**validated_data)
 
 
 class ActivitySummarySerializer(serializers.Serializer):
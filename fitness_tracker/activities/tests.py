@@ -1,9 +1,10 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from datetime import date, timedelta
+from datetime import date, time, timedelta
 from decimal import Decimal
 from .models import Activity
 
@@ -13,15 +14,16 @@ class ActivityModelTest(TestCase):
     Test cases for Activity model
     """
     
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         
-        self.activity = Activity.objects.create(
-            user=self.user,
+        cls.activity = Activity.objects.create(
+            user=cls.user,
             activity_type='RUNNING',
             duration=30,
             distance=Decimal('5.0'),
@@ -67,46 +69,53 @@ class ActivityAPITest(APITestCase):
     Test cases for Activity API endpoints
     """
     
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.other_user = User.objects.create_user(
+        cls.other_user = User.objects.create_user(
             username='otheruser',
             email='other@example.com',
             password='testpass123'
         )
         
         # Create test activities
-        self.activity1 = Activity.objects.create(
-            user=self.user,
-            activity_type='RUNNING',
-            duration=30,
-            distance=Decimal('5.0'),
-            calories_burned=300,
-            date=date.today()
-        )
-        
-        self.activity2 = Activity.objects.create(
-            user=self.user,
-            activity_type='CYCLING',
-            duration=60,
-            distance=Decimal('20.0'),
-            calories_burned=500,
-            date=date.today() - timedelta(days=1)
-        )
-        
-        self.other_activity = Activity.objects.create(
-            user=self.other_user,
-            activity_type='SWIMMING',
-            duration=45,
-            distance=Decimal('2.0'),
-            calories_burned=400,
-            date=date.today()
-        )
+        activities = [
+            Activity(
+                user=cls.user,
+                activity_type='RUNNING',
+                duration=30,
+                distance=Decimal('5.0'),
+                calories_burned=300,
+                date=date.today()
+            ),
+            Activity(
+                user=cls.user,
+                activity_type='CYCLING',
+                duration=60,
+                distance=Decimal('20.0'),
+                calories_burned=500,
+                date=date.today() - timedelta(days=1)
+            ),
+            Activity(
+                user=cls.other_user,
+                activity_type='SWIMMING',
+                duration=45,
+                distance=Decimal('2.0'),
+                calories_burned=400,
+                date=date.today()
+            ),
+        ]
+        for activity in activities:
+            activity.populate_derived_fields()
+        cls.activity1, cls.activity2, cls.other_activity = Activity.objects.bulk_create(activities)
+    
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
     
     def test_list_activities_unauthenticated(self):
         """Test that unauthenticated users cannot list activities"""
@@ -121,7 +130,90 @@ class ActivityAPITest(APITestCase):
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)  # User should only see their activities
+        self.assertEqual(len(response.data['results']), 2)  # User should only see their activities
+    
+    def test_list_activities_query_count(self):
+        """Test listing activities does not query the user per row"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:activity-list-create')
+        
+        with self.assertNumQueries(1):  # single keyset page query
+            response = self.client.get(url)
+        self.assertEqual(response.data['results'][0]['user'], self.user.username)
+    
+    def test_list_matches_detail_representation(self):
+        """Test list rows are rendered exactly like the detail serializer"""
+        Activity.objects.filter(pk=self.activity1.pk).update(
+            start_time=time(7, 30),
+            elevation_gain=Decimal('12.5')
+        )
+        self.client.force_authenticate(user=self.user)
+        list_response = self.client.get(reverse('activities:activity-list-create'))
+        detail_response = self.client.get(
+            reverse('activities:activity-detail', kwargs={'pk': self.activity1.pk})
+        )
+        
+        listed = next(
+            item for item in list_response.data['results']
+            if item['id'] == self.activity1.pk
+        )
+        self.assertEqual(listed, detail_response.data)
+    
+    def test_list_activities_selected_fields(self):
+        """Test ?fields= limits the serialized fields and loaded columns"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:activity-list-create')
+        
+        with self.assertNumQueries(1):  # no deferred loads
+            response = self.client.get(url, {'fields': 'id,user,activity_type_display,duration'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data['results'][0]),
+            {'id', 'user', 'activity_type_display', 'duration'}
+        )
+    
+    def test_list_activities_cursor_pagination(self):
+        """Test following the next cursor returns the following page"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:activity-list-create')
+        
+        first = self.client.get(url, {'page_size': 1, 'fields': 'id'})
+        self.assertEqual(first.data['results'], [{'id': self.activity1.pk}])
+        
+        second = self.client.get(first.data['next'])
+        self.assertEqual(second.data['results'], [{'id': self.activity2.pk}])
+        self.assertIsNone(second.data['next'])
+    
+    def test_list_activities_custom_ordering_reaches_every_row(self):
+        """Test paging through nullable and duplicated orderings returns every row"""
+        activities = [
+            Activity(
+                user=self.user,
+                activity_type='WALKING',
+                duration=30,
+                distance=Decimal(i) if i < 3 else None,
+                date=date.today() - timedelta(days=i)
+            )
+            for i in range(13)
+        ]
+        for activity in activities:
+            activity.populate_derived_fields()
+        Activity.objects.bulk_create(activities)
+        expected = set(Activity.objects.filter(user=self.user).values_list('id', flat=True))
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:activity-list-create')
+        
+        for ordering in ('-distance', 'distance', 'calories_burned', '-duration'):
+            seen = []
+            response = self.client.get(url, {'ordering': ordering, 'page_size': 5, 'fields': 'id'})
+            while True:
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                seen.extend(item['id'] for item in response.data['results'])
+                if not response.data['next']:
+                    break
+                response = self.client.get(response.data['next'])
+            self.assertEqual(len(seen), len(expected), ordering)
+            self.assertEqual(set(seen), expected, ordering)
     
     def test_create_activity(self):
         """Test creating a new activity"""
@@ -138,6 +230,23 @@ class ActivityAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Activity.objects.filter(user=self.user).count(), 3)
     
+    def test_create_activity_extreme_pace(self):
+        """Test the largest duration over the smallest distance still stores its pace"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:activity-list-create')
+        response = self.client.post(url, {
+            'activity_type': 'WALKING',
+            'duration': 2147483647,
+            'distance': '0.01',
+            'date': date.today().isoformat()
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        
+        activity = Activity.objects.get(user=self.user, duration=2147483647)
+        response = self.client.get(reverse('activities:activity-detail', kwargs={'pk': activity.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['pace'], '214748364700.00')
+    
     def test_retrieve_activity(self):
         """Test retrieving a specific activity"""
         self.client.force_authenticate(user=self.user)
@@ -146,6 +255,8 @@ class ActivityAPITest(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['activity_type'], 'RUNNING')
+        self.assertEqual(response.data['activity_type_display'], 'Running')
+        self.assertEqual(response.data['intensity_display'], 'Moderate')
     
     def test_retrieve_other_user_activity(self):
         """Test that user cannot retrieve another user's activity"""
@@ -173,6 +284,15 @@ class ActivityAPITest(APITestCase):
         self.assertEqual(self.activity1.duration, 40)
         self.assertEqual(self.activity1.calories_burned, 350)
     
+    def test_update_activity_future_date(self):
+        """Test that an activity date in the future is rejected"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:activity-detail', kwargs={'pk': self.activity1.pk})
+        data = {'date': (date.today() + timedelta(days=2)).isoformat()}
+        
+        response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
     def test_delete_activity(self):
         """Test deleting an activity"""
         self.client.force_authenticate(user=self.user)
@@ -189,7 +309,7 @@ class ActivityAPITest(APITestCase):
         response = self.client.get(url, {'activity_type': 'RUNNING'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(len(response.data['results']), 1)
     
     def test_filter_by_date_range(self):
         """Test filtering activities by date range"""
@@ -201,7 +321,63 @@ class ActivityAPITest(APITestCase):
         })
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(response.data['results']), 2)
+    
+    def test_statistics_single_query(self):
+        """Test metrics and type stats each evaluate one SQL query"""
+        self.client.force_authenticate(user=self.user)
+        
+        with self.assertNumQueries(1):
+            self.client.get(reverse('activities:activity-metrics'))
+        with self.assertNumQueries(1):
+            self.client.get(reverse('activities:activity-type-stats'))
+    
+    def test_metrics_cache_invalidated_on_delete(self):
+        """Test cached metrics are refreshed after an activity is deleted"""
+        self.client.force_authenticate(user=self.user)
+        metrics_url = reverse('activities:activity-metrics')
+        self.assertEqual(self.client.get(metrics_url).data['total_activities'], 2)
+        
+        self.client.delete(
+            reverse('activities:activity-detail', kwargs={'pk': self.activity1.pk})
+        )
+        
+        self.assertEqual(self.client.get(metrics_url).data['total_activities'], 1)
+    
+    def test_activity_type_stats(self):
+        """Test per-type statistics endpoint"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:activity-type-stats')
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = {item['activity_type']: item for item in response.data}
+        self.assertEqual(set(stats), {'RUNNING', 'CYCLING'})
+        self.assertEqual(stats['CYCLING']['total_duration'], 60)
+        self.assertEqual(stats['CYCLING']['average_distance'], '20.00')
+        self.assertEqual(stats['RUNNING']['average_calories'], '300.00')
+    
+    def test_recent_activities(self):
+        """Test recent activities are returned newest first"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:recent-activities')
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['id'] for item in response.data],
+            [self.activity1.pk, self.activity2.pk]
+        )
+        self.assertEqual(response.data[0]['user'], self.user.username)
+    
+    def test_search_activities(self):
+        """Test searching activities by title"""
+        self.client.force_authenticate(user=self.user)
+        url = reverse('activities:activity-list-create')
+        response = self.client.get(url, {'search': 'cycling'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
     
     def test_activity_metrics(self):
         """Test activity metrics endpoint"""
@@ -212,3 +388,72 @@ class ActivityAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['total_activities'], 2)
         self.assertEqual(response.data['total_duration'], 90)  # 30 + 60
+        self.assertEqual(response.data['average_duration'], '45.00')
+        self.assertEqual(response.data['total_distance'], '25.00')
+        self.assertEqual(response.data['activity_breakdown'], {'RUNNING': 1, 'CYCLING': 1})
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class ActivityAdminTest(TestCase):
+    """
+    Test cases for Activity admin actions
+    """
+    
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.activity = Activity.objects.create(
+            user=self.user,
+            activity_type='RUNNING',
+            duration=30,
+            distance=Decimal('5.0'),
+            date=date.today()
+        )
+    
+    def test_duplicate_activity(self):
+        """Test selected activities are duplicated with a (Copy) title"""
+        self.client.force_login(self.user)
+        url = reverse('admin:activities_activity_changelist')
+        cache.set(f"act:{self.user.pk}:version", 1, None)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, {
+                'action': 'duplicate_activity',
+                '_selected_action': [self.activity.pk],
+            })
+        
+        self.assertEqual(response.status_code, 302)
+        # The owner's cached activity responses are invalidated
+        self.assertNotEqual(cache.get(f"act:{self.user.pk}:version"), 1)
+        self.assertEqual(Activity.objects.count(), 2)
+        copy = Activity.objects.exclude(pk=self.activity.pk).get()
+        self.assertEqual(copy.title, f"{self.activity.title} (Copy)")
+        self.assertEqual(copy.distance, self.activity.distance)
+        self.assertEqual(copy.pace, self.activity.pace)
+    
+    def test_add_future_date_shows_form_error(self):
+        """Test the admin form rejects a future date instead of failing on save"""
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('admin:activities_activity_add'), {
+            'user': self.user.pk,
+            'activity_type': 'RUNNING',
+            'title': 'Future run',
+            'duration': 30,
+            'intensity': 'MODERATE',
+            'date': (date.today() + timedelta(days=30)).isoformat(),
+        })
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('date', response.context['adminform'].form.errors)
+        self.assertEqual(Activity.objects.count(), 1)
+    
+    def test_changelist_user_filter(self):
+        """Test the changelist renders and filters by user"""
+        self.client.force_login(self.user)
+        url = reverse('admin:activities_activity_changelist')
+        response = self.client.get(url, {'user__id__exact': self.user.pk})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['cl'].result_count, 1)
@@ -2,8 +2,11 @@ from django.shortcuts import render
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
-from django.db.models import Sum, Avg, Count, Q, Max, Min
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.settings import api_settings
+from django.core.cache import cache
+from django.db.models import Sum, Avg, Count, Q, Max, Min, Value
+from django.db.models.functions import Coalesce, Round
 from django.utils import timezone
 from datetime import timedelta
 from decimal import Decimal
@@ -15,15 +18,61 @@ from .serializers import (
     ActivityTypeStatsSerializer
 )
 from .filters import ActivityFilter
+from .cache import (
+    ACTIVITY_CACHE_TIMEOUT,
+    activity_cache_key,
+    invalidate_activity_cache
+)
 
 
-class ActivityPagination(PageNumberPagination):
+class ActivityOffsetPagination(PageNumberPagination):
     """
-    Custom pagination for activities
+    Page-number pagination for activities sorted with a custom ?ordering=
     """
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        # Break ties on the sort column so offsets are stable across pages
+        queryset = queryset.order_by(*queryset.query.order_by, '-id')
+        return super().paginate_queryset(queryset, request, view)
+
+
+class ActivityPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination for activities, so page cost does not grow
+    with page depth; the default ordering walks the
+    (user, -date, -created_at) index
+    
+    A cursor is only safe on a non-null, tie-broken ordering. A custom
+    ?ordering= may sort on nullable or duplicated columns (distance,
+    calories_burned, duration), where a cursor would skip rows, so those
+    requests fall back to page-number pagination.
+    """
+    ordering = ('-date', '-created_at', '-id')
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        self.offset_paginator = None
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            self.offset_paginator = ActivityOffsetPagination()
+            page = self.offset_paginator.paginate_queryset(queryset, request, view)
+            self.display_page_controls = self.offset_paginator.display_page_controls
+            return page
+        return super().paginate_queryset(queryset, request, view)
+    
+    def get_paginated_response(self, data):
+        if self.offset_paginator is not None:
+            return self.offset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+    
+    def to_html(self):
+        if self.offset_paginator is not None:
+            return self.offset_paginator.to_html()
+        return super().to_html()
 
 
 class ActivityListCreateView(generics.ListCreateAPIView):
@@ -36,21 +85,51 @@ class ActivityListCreateView(generics.ListCreateAPIView):
     pagination_class = ActivityPagination
     filterset_class = ActivityFilter
     ordering_fields = ['date', 'duration', 'distance', 'calories_burned', 'created_at']
-    ordering = ['-date', '-created_at']
+    ordering = ['-date', '-created_at', '-id']
+    
+    def get_requested_fields(self):
+        """
+        Fields selected with ?fields=a,b,c on GET requests, if any
+        """
+        if self.request.method != 'GET':
+            return None
+        return ActivitySerializer.parse_fields(self.request.query_params.get('fields'))
     
     def get_queryset(self):
         """
         Return activities for the current user only
         """
-        return Activity.objects.filter(user=self.request.user)
+        return Activity.objects.filter(user=self.request.user).select_related('user')
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return ActivityCreateSerializer
         return ActivitySerializer
     
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+        if fields:
+            kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List activities from .values() rows instead of model instances
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        # The cursor is built from the ordering columns, so always fetch them
+        ordering = [name.lstrip('-') for name in self.paginator.get_ordering(request, queryset, self)]
+        rows = queryset.values(*{*serializer.get_values_keys(), *ordering})
+        
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation_rows(page))
+        return Response(serializer.to_representation_rows(rows))
+    
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+        invalidate_activity_cache(self.request.user.pk)
 
 
 class ActivityDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -66,12 +145,20 @@ class ActivityDetailView(generics.RetrieveUpdateDestroyAPIView):
         """
         Ensure users can only access their own activities
         """
-        return Activity.objects.filter(user=self.request.user)
+        return Activity.objects.filter(user=self.request.user).select_related('user')
     
     def get_serializer_class(self):
         if self.request.method in ['PUT', 'PATCH']:
             return ActivityCreateSerializer
         return ActivitySerializer
+    
+    def perform_update(self, serializer):
+        serializer.save()
+        invalidate_activity_cache(self.request.user.pk)
+    
+    def perform_destroy(self, instance):
+        instance.delete()
+        invalidate_activity_cache(self.request.user.pk)
 
 
 @api_view(['GET'])
@@ -89,6 +176,11 @@ def activity_metrics(request):
     """
     user = request.user
     
+    cache_key = activity_cache_key(request)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return Response(cached)
+    
     # Get query parameters
     date_from = request.query_params.get('date_from')
     date_to = request.query_params.get('date_to')
@@ -115,45 +207,48 @@ def activity_metrics(request):
     if activity_type:
         queryset = queryset.filter(activity_type=activity_type)
     
-    # Calculate summary statistics
-    stats = queryset.aggregate(
-        total_activities=Count('id'),
-        total_duration=Sum('duration'),
-        total_distance=Sum('distance'),
-        total_calories=Sum('calories_burned'),
-        average_duration=Avg('duration'),
-        average_distance=Avg('distance'),
-        average_calories=Avg('calories_burned'),
-    )
-    
-    # Get activity breakdown by type
-    activity_breakdown = queryset.values('activity_type').annotate(
-        count=Count('id')
-    ).order_by('-count')
+    # Per-type breakdown and the sums needed for the overall summary,
+    # fetched in a single grouped query
+    breakdown = list(queryset.values('activity_type').annotate(
+        count=Count('id'),
+        total_duration=Coalesce(Sum('duration'), 0),
+        total_distance=Coalesce(Sum('distance'), Value(Decimal('0.00'))),
+        distance_count=Count('distance'),
+        total_calories=Coalesce(Sum('calories_burned'), 0),
+        calories_count=Count('calories_burned'),
+    ).order_by('-count'))
     
     breakdown_dict = {
-        item['activity_type']: item['count'] 
-        for item in activity_breakdown
+        item['activity_type']: item['count']
+        for item in breakdown
     }
     
     # Find most common activity
-    most_common = activity_breakdown.first()
-    most_common_activity = most_common['activity_type'] if most_common else None
+    most_common_activity = breakdown[0]['activity_type'] if breakdown else None
+    
+    # Fold the per-type rows into overall totals and averages
+    total_activities = sum(item['count'] for item in breakdown)
+    total_duration = sum(item['total_duration'] for item in breakdown)
+    total_distance = sum((item['total_distance'] for item in breakdown), Decimal('0.00'))
+    total_calories = sum(item['total_calories'] for item in breakdown)
+    distance_count = sum(item['distance_count'] for item in breakdown)
+    calories_count = sum(item['calories_count'] for item in breakdown)
     
     # Prepare response data
     summary_data = {
-        'total_activities': stats['total_activities'] or 0,
-        'total_duration': stats['total_duration'] or 0,
-        'total_distance': stats['total_distance'] or Decimal('0.00'),
-        'total_calories': stats['total_calories'] or 0,
-        'average_duration': round(stats['average_duration'] or 0, 2),
-        'average_distance': round(stats['average_distance'] or 0, 2),
-        'average_calories': round(stats['average_calories'] or 0, 2),
+        'total_activities': total_activities,
+        'total_duration': total_duration,
+        'total_distance': total_distance,
+        'total_calories': total_calories,
+        'average_duration': round(total_duration / total_activities, 2) if total_activities else 0,
+        'average_distance': round(total_distance / distance_count, 2) if distance_count else 0,
+        'average_calories': round(total_calories / calories_count, 2) if calories_count else 0,
         'most_common_activity': most_common_activity,
         'activity_breakdown': breakdown_dict,
     }
     
     serializer = ActivitySummarySerializer(summary_data)
+    cache.set(cache_key, serializer.data, ACTIVITY_CACHE_TIMEOUT)
     return Response(serializer.data)
 
 
@@ -178,32 +273,19 @@ def activity_type_stats(request):
     if date_to:
         queryset = queryset.filter(date__lte=date_to)
     
-    # Get stats by activity type
+    # Get stats by activity type, with null sums/averages coalesced and
+    # averages rounded in SQL
     type_stats = queryset.values('activity_type').annotate(
         count=Count('id'),
-        total_duration=Sum('duration'),
-        total_distance=Sum('distance'),
-        total_calories=Sum('calories_burned'),
-        average_duration=Avg('duration'),
-        average_distance=Avg('distance'),
-        average_calories=Avg('calories_burned'),
+        total_duration=Coalesce(Sum('duration'), 0),
+        total_distance=Coalesce(Sum('distance'), Value(Decimal('0.00'))),
+        total_calories=Coalesce(Sum('calories_burned'), 0),
+        average_duration=Round(Coalesce(Avg('duration'), 0.0), 2),
+        average_distance=Round(Coalesce(Avg('distance'), Value(Decimal('0.00'))), 2),
+        average_calories=Round(Coalesce(Avg('calories_burned'), 0.0), 2),
     ).order_by('-count')
     
-    # Format the data
-    stats_list = []
-    for stat in type_stats:
-        stats_list.append({
-            'activity_type': stat['activity_type'],
-            'count': stat['count'],
-            'total_duration': stat['total_duration'] or 0,
-            'total_distance': round(stat['total_distance'] or 0, 2),
-            'total_calories': stat['total_calories'] or 0,
-            'average_duration': round(stat['average_duration'] or 0, 2),
-            'average_distance': round(stat['average_distance'] or 0, 2),
-            'average_calories': round(stat['average_calories'] or 0, 2),
-        })
-    
-    serializer = ActivityTypeStatsSerializer(stats_list, many=True)
+    serializer = ActivityTypeStatsSerializer(type_stats, many=True)
     return Response(serializer.data)
 
 
@@ -213,8 +295,20 @@ def recent_activities(request):
     """
     Get recent activities (last 10)
     GET /api/activities/recent/
+    
+    Query parameters:
+    - fields: Comma-separated subset of fields to return
     """
     user = request.user
-    activities = Activity.objects.filter(user=user).order_by('-date', '-created_at')[:10]
-    serializer = ActivitySerializer(activities, many=True)
-    return Response(serializer.data)
\ No newline at end of file
+    serializer = ActivitySerializer(
+        fields=ActivitySerializer.parse_fields(request.query_params.get('fields'))
+    )
+    
+    def load_recent():
+        rows = Activity.objects.filter(user=user).order_by(
+            '-date', '-created_at'
+        ).values(*serializer.get_values_keys())[:10]
+        return serializer.to_representation_rows(rows)
+    
+    data = cache.get_or_set(activity_cache_key(request), load_recent, ACTIVITY_CACHE_TIMEOUT)
+    return Response(data)
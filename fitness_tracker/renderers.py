@@ -0,0 +1,55 @@
+import math
+from decimal import Decimal
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def _has_non_finite(data):
+    """Return True if data contains a NaN or infinite float or Decimal"""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, Decimal):
+        return not data.is_finite()
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson
+
+    Native types are encoded in C; anything orjson doesn't handle itself
+    (Decimal, lazy strings, querysets, ...) falls back to DRF's encoder.
+    Compact output is byte-for-byte what JSONRenderer produces; indented
+    output (browsable API) uses two spaces, the only indent orjson offers.
+    """
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        # json.dumps accepts non-str keys (e.g. the int keys of ListField
+        # errors); orjson needs this option to do the same
+        option = orjson.OPT_NON_STR_KEYS
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            # orjson only supports a two-space indent
+            option |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self.encoder.default, option=option)
+
+        # orjson writes NaN and infinity as null; like json.dumps with
+        # allow_nan=False, refuse them under STRICT_JSON. They can only
+        # be present where a null was written.
+        if self.strict and b'null' in ret and _has_non_finite(data):
+            raise ValueError("Out of range float values are not JSON compliant")
+
+        # Escape the line and paragraph separators, as JSONRenderer does, so
+        # the output is also valid JavaScript
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
 from .models import UserProfile
@@ -32,12 +32,26 @@ admin.site.unregister(User)
 admin.site.register(User, UserAdmin)
 
 
+class UserProfileChangeList(ChangeList):
+    """
+    Changelist that loads only the columns it displays
+
+    Trimming happens in get_results(), so admin actions, which get their
+    queryset from get_queryset(), still receive full rows.
+    """
+    
+    def get_results(self, request):
+        self.queryset = self.queryset.only(*self.model_admin.changelist_only_fields)
+        super().get_results(request)
+
+
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     """
     Admin for UserProfile model
     """
     list_display = ('user', 'gender', 'age', 'height', 'weight', 'bmi', 'created_at')
+    list_select_related = ('user',)
     list_filter = ('gender', 'created_at')
     search_fields = ('user__username', 'user__email', 'user__first_name', 'user__last_name')
     readonly_fields = ('created_at', 'updated_at', 'age', 'bmi')
@@ -56,4 +70,14 @@ class UserProfileAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
-    )
\ No newline at end of file
+    )
+    
+    # Columns rendered by the changelist; bio and profile_picture are only
+    # needed on the change form
+    changelist_only_fields = (
+        'id', 'user__id', 'user__username', 'gender', 'height', 'weight',
+        'date_of_birth', 'created_at'
+    )
+    
+    def get_changelist(self, request, **kwargs):
+        return UserProfileChangeList
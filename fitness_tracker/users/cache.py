@@ -0,0 +1,28 @@
+import time
+from django.core.cache import cache
+
+
+# Seconds that a rendered /me/ response stays cached
+CURRENT_USER_CACHE_TIMEOUT = 300
+
+
+def current_user_cache_key(user):
+    """
+    Build the cache key for a user's rendered /me/ response
+    
+    The key embeds the user's cache version and the updated_at of the
+    profile loaded with the user, so a response rendered from a user loaded
+    before a concurrent write is stored under a key that fresh requests no
+    longer look up.
+    """
+    version = cache.get_or_set(f"user:{user.pk}:version", time.time_ns, None)
+    profile = getattr(user, 'profile', None)
+    stamp = profile.updated_at.timestamp() if profile else 'none'
+    return f"user:{user.pk}:v{version}:me:{stamp}"
+
+
+def invalidate_current_user_cache(user_id):
+    """
+    Invalidate a user's cached /me/ response
+    """
+    cache.set(f"user:{user_id}:version", time.time_ns(), None)
@@ -0,0 +1,65 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def create_email_index(apps, schema_editor):
+    """
+    Enforce unique, non-blank emails on auth_user so registration can rely
+    on the database instead of a separate existence check
+    """
+    User = apps.get_model('auth', 'User')
+    duplicates = list(
+        User.objects.using(schema_editor.connection.alias)
+        .exclude(email='')
+        .values('email')
+        .annotate(users=Count('id'))
+        .filter(users__gt=1)
+        .values_list('email', flat=True)[:10]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add a unique index on auth_user.email: these emails belong "
+            f"to more than one user: {', '.join(duplicates)}. "
+            "Resolve them and run the migration again."
+        )
+
+    if schema_editor.connection.vendor == 'postgresql':
+        # A failed CONCURRENTLY build leaves an INVALID index behind; drop it
+        # so the index below is really built rather than silently kept
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT NOT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = 'auth_user_email_uniq'"
+            )
+            row = cursor.fetchone()
+        if row and row[0]:
+            schema_editor.execute("DROP INDEX CONCURRENTLY auth_user_email_uniq")
+        schema_editor.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY auth_user_email_uniq "
+            "ON auth_user (email) WHERE email <> ''"
+        )
+    else:
+        schema_editor.execute(
+            "CREATE UNIQUE INDEX auth_user_email_uniq "
+            "ON auth_user (email) WHERE email <> ''"
+        )
+
+
+def drop_email_index(apps, schema_editor):
+    schema_editor.execute("DROP INDEX IF EXISTS auth_user_email_uniq")
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_email_index, drop_email_index),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.9 on 2026-10-15 17:34
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+def create_user_search_index(apps, schema_editor):
+    """
+    Create a trigram GIN index over the auth_user columns searched by the
+    UserProfile admin, matching the UPPER(col) LIKE '%term%' form of
+    icontains (PostgreSQL only)
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS auth_user_search_trgm ON auth_user USING gin ("
+        "UPPER(username) gin_trgm_ops, UPPER(email) gin_trgm_ops, "
+        "UPPER(first_name) gin_trgm_ops, UPPER(last_name) gin_trgm_ops)"
+    )
+
+
+def drop_user_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS auth_user_search_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_profile_height_weight_float'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['-created_at'], name='profile_created_idx'),
+        ),
+        TrigramExtension(),
+        migrations.RunPython(create_user_search_index, drop_user_search_index),
+    ]
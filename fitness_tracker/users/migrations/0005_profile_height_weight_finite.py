@@ -0,0 +1,25 @@
+# Generated by Django 4.2.9 on 2026-10-15 17:56
+
+import django.core.validators
+from django.db import migrations, models
+import users.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_profile_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='height',
+            field=models.FloatField(blank=True, help_text='Height in centimeters', null=True, validators=[users.models.validate_finite, django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(500.0)]),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='weight',
+            field=models.FloatField(blank=True, help_text='Weight in kilograms', null=True, validators=[users.models.validate_finite, django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(500.0)]),
+        ),
+    ]
@@ -1,37 +1,60 @@
+import math
+from datetime import date
+from functools import cached_property
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
+def validate_finite(value):
+    """Reject NaN and infinite values, which range validators let through"""
+    if value is not None and not math.isfinite(value):
+        raise ValidationError("Enter a finite number.", code='invalid')
+
+
+def calculate_age(date_of_birth):
+    """Calculate age in years from a date of birth"""
+    if date_of_birth:
+        today = date.today()
+        return today.year - date_of_birth.year - (
+            (today.month, today.day) < (date_of_birth.month, date_of_birth.day)
+        )
+    return None
+
+
+def calculate_bmi(height, weight):
+    """Calculate BMI from height (cm) and weight (kg) if both are available"""
+    if height and weight:
+        return round(weight / (height * height) * 10000, 2)
+    return None
+
+
 class UserProfile(models.Model):
     """
     Extended user profile with additional fitness-related information
     """
-    GENDER_CHOICES = [
+    GENDER_CHOICES = (
         ('M', 'Male'),
         ('F', 'Female'),
         ('O', 'Other'),
         ('N', 'Prefer not to say'),
-    ]
+    )
     
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
     date_of_birth = models.DateField(null=True, blank=True)
     gender = models.CharField(max_length=1, choices=GENDER_CHOICES, null=True, blank=True)
-    height = models.DecimalField(
-        max_digits=5, 
-        decimal_places=2, 
+    height = models.FloatField(
         null=True, 
         blank=True,
         help_text="Height in centimeters",
-        validators=[MinValueValidator(0)]
+        validators=[validate_finite, MinValueValidator(0.0), MaxValueValidator(500.0)]
     )
-    weight = models.DecimalField(
-        max_digits=5, 
-        decimal_places=2, 
+    weight = models.FloatField(
         null=True, 
         blank=True,
         help_text="Weight in kilograms",
-        validators=[MinValueValidator(0)]
+        validators=[validate_finite, MinValueValidator(0.0), MaxValueValidator(500.0)]
     )
     bio = models.TextField(max_length=500, blank=True)
     profile_picture = models.URLField(blank=True, null=True)
@@ -41,25 +64,23 @@ class UserProfile(models.Model):
     class Meta:
         db_table = 'user_profiles'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='profile_created_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.user.username}'s Profile"
+        # Only use the username when the user is already loaded, so that
+        # str() never issues a query of its own
+        if UserProfile.user.is_cached(self):
+            return f"{self.user.username}'s Profile"
+        return f"Profile<{self.user_id}>"
     
-    @property
+    @cached_property
     def age(self):
         """Calculate age from date of birth"""
-        if self.date_of_birth:
-            from datetime import date
-            today = date.today()
-            return today.year - self.date_of_birth.year - (
-                (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
-            )
-        return None
+        return calculate_age(self.date_of_birth)
     
-    @property
+    @cached_property
     def bmi(self):
         """Calculate BMI if height and weight are available"""
-        if self.height and self.weight:
-            height_in_meters = float(self.height) / 100
-            return round(float(self.weight) / (height_in_meters ** 2), 2)
-        return None
\ No newline at end of file
+        return calculate_bmi(self.height, self.weight)
\ No newline at end of file
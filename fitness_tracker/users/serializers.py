@@ -1,10 +1,30 @@
+import copy
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
 from django.contrib.auth.password_validation import validate_password
-from .models import UserProfile
+from .models import UserProfile, calculate_age, calculate_bmi
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class and give each instance
+    shallow copies, instead of deep-copying declared fields and walking
+    the model _meta on every instantiation
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return {name: copy.copy(field) for name, field in fields.items()}
+
+
+class UserProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for UserProfile model
     """
@@ -19,9 +39,18 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
+    
+    def to_representation(self, instance):
+        empty = _empty_profile_representation(
+            instance.date_of_birth, instance.gender, instance.height, instance.weight,
+            instance.bio, instance.profile_picture, instance.created_at, instance.updated_at
+        )
+        if empty is not None:
+            return empty
+        return super().to_representation(instance)
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for User model with profile
     """
@@ -33,7 +62,117 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'date_joined']
 
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+# Fast read path: build the UserSerializer output from plain values
+# without instantiating serializers per request
+USER_VALUES_FIELDS = ['id', 'username', 'email', 'first_name', 'last_name', 'date_joined']
+PROFILE_VALUES_FIELDS = [
+    'date_of_birth', 'gender', 'height', 'weight',
+    'bio', 'profile_picture', 'created_at', 'updated_at'
+]
+
+_DATETIME_FIELD = serializers.DateTimeField()
+_DATE_FIELD = serializers.DateField()
+
+
+def _represent(field, value):
+    return None if value is None else field.to_representation(value)
+
+
+def _empty_profile_representation(date_of_birth, gender, height, weight, bio,
+                                  profile_picture, created_at, updated_at):
+    """
+    Render a profile that has never been filled in (the common case right
+    after registration) without going through per-field serialization.
+    Returns None if any optional field is set.
+    """
+    if (date_of_birth is not None or gender is not None or height is not None
+            or weight is not None or bio or profile_picture):
+        return None
+    return {
+        'date_of_birth': None,
+        'gender': None,
+        'height': None,
+        'weight': None,
+        'bio': bio,
+        'profile_picture': profile_picture,
+        'age': None,
+        'bmi': None,
+        'created_at': _represent(_DATETIME_FIELD, created_at),
+        'updated_at': _represent(_DATETIME_FIELD, updated_at),
+    }
+
+
+def user_row(user):
+    """
+    Flatten a user and its cached profile into a .values()-style row
+    """
+    row = {name: getattr(user, name) for name in USER_VALUES_FIELDS}
+    profile = getattr(user, 'profile', None)
+    for name in PROFILE_VALUES_FIELDS:
+        row[f'profile__{name}'] = getattr(profile, name) if profile else None
+    return row
+
+
+def user_to_representation(row):
+    """
+    Render a flat user row exactly like UserSerializer would
+    """
+    data = {
+        'id': row['id'],
+        'username': row['username'],
+        'email': row['email'],
+        'first_name': row['first_name'],
+        'last_name': row['last_name'],
+    }
+    # created_at is never null, so a null means the user has no profile
+    if row['profile__created_at'] is not None:
+        data['profile'] = _empty_profile_representation(
+            **{name: row[f'profile__{name}'] for name in PROFILE_VALUES_FIELDS}
+        ) or {
+            'date_of_birth': _represent(_DATE_FIELD, row['profile__date_of_birth']),
+            'gender': row['profile__gender'],
+            'height': row['profile__height'],
+            'weight': row['profile__weight'],
+            'bio': row['profile__bio'],
+            'profile_picture': row['profile__profile_picture'],
+            'age': calculate_age(row['profile__date_of_birth']),
+            'bmi': calculate_bmi(row['profile__height'], row['profile__weight']),
+            'created_at': _represent(_DATETIME_FIELD, row['profile__created_at']),
+            'updated_at': _represent(_DATETIME_FIELD, row['profile__updated_at']),
+        }
+    data['date_joined'] = _represent(_DATETIME_FIELD, row['date_joined'])
+    return data
+
+
+def fetch_user_representation(**lookup):
+    """
+    Fetch a user and profile with a single .values() query and render them
+    """
+    row = User.objects.filter(**lookup).values(
+        *USER_VALUES_FIELDS,
+        *(f'profile__{name}' for name in PROFILE_VALUES_FIELDS)
+    ).first()
+    return user_to_representation(row) if row else None
+
+
+def _update_profile(user, profile_data):
+    """
+    Write profile fields with a single UPDATE and mirror them onto the
+    user's cached profile, if one is loaded
+    """
+    profile_data = dict(profile_data, updated_at=timezone.now())
+    UserProfile.objects.filter(user_id=user.pk).update(**profile_data)
+    
+    profile = user.profile if User.profile.is_cached(user) else None
+    if profile is not None:
+        for attr, value in profile_data.items():
+            setattr(profile, attr, value)
+        # Drop derived values computed from the old fields
+        profile.__dict__.pop('age', None)
+        profile.__dict__.pop('bmi', None)
+
+
+class UserRegistrationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user registration
     """
@@ -59,27 +198,35 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'first_name': {'required': False},
             'last_name': {'required': False},
-            'email': {'required': True}
+            'email': {'required': True},
+            # Uniqueness is checked together with email in validate()
+            'username': {'validators': [User.username_validator]},
         }
     
     def validate(self, attrs):
         """
-        Validate that passwords match
+        Validate that passwords match and that username and email are free,
+        checking both with a single query
         """
         if attrs['password'] != attrs['password2']:
             raise serializers.ValidationError({
                 "password": "Password fields didn't match."
             })
+        
+        errors = {}
+        taken = User.objects.filter(
+            Q(username=attrs['username']) | Q(email=attrs['email'])
+        ).values_list('username', 'email')
+        for username, email in taken:
+            if username == attrs['username']:
+                errors['username'] = "A user with that username already exists."
+            if email == attrs['email']:
+                errors['email'] = "A user with this email already exists."
+        if errors:
+            raise serializers.ValidationError(errors)
+        
         return attrs
     
-    def validate_email(self, value):
-        """
-        Check that email is unique
-        """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
-    
     def create(self, validated_data):
         """
         Create user with hashed password and profile
@@ -87,24 +234,29 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         validated_data.pop('password2')
         profile_data = validated_data.pop('profile', {})
         
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password'],
-            first_name=validated_data.get('first_name', ''),
-            last_name=validated_data.get('last_name', '')
-        )
-        
-        # Update profile if data provided
-        if profile_data:
-            for attr, value in profile_data.items():
-                setattr(user.profile, attr, value)
-            user.profile.save()
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=validated_data['username'],
+                    email=validated_data['email'],
+                    password=validated_data['password'],
+                    first_name=validated_data.get('first_name', ''),
+                    last_name=validated_data.get('last_name', '')
+                )
+                
+                # The post_save signal created a blank profile; fill it in place
+                if profile_data:
+                    _update_profile(user, profile_data)
+        except IntegrityError:
+            # Lost a race with a concurrent registration
+            raise serializers.ValidationError(
+                "A user with that username or email already exists."
+            )
         
         return user
 
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+class UserUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for updating user information
     """
@@ -114,25 +266,38 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         model = User
         fields = ['email', 'first_name', 'last_name', 'profile']
     
+    def validate_email(self, value):
+        """
+        Check that no other user has this email
+        """
+        if value and User.objects.filter(email=value).exclude(pk=self.instance.pk).exists():
+            raise serializers.ValidationError("A user with this email already exists.")
+        return value
+    
     def update(self, instance, validated_data):
         """
         Update user and profile
         """
         profile_data = validated_data.pop('profile', {})
         
-        # Update user fields
-        instance.email = validated_data.get('email', instance.email)
-        instance.first_name = validated_data.get('first_name', instance.first_name)
-        instance.last_name = validated_data.get('last_name', instance.last_name)
-        instance.save()
-        
-        # Update profile fields
-        if profile_data:
-            profile = instance.profile
-            for attr, value in profile_data.items():
-                setattr(profile, attr, value)
-            profile.save()
+        try:
+            with transaction.atomic():
+                # Update user fields without a full save, which would also
+                # re-save the profile through the post_save signal
+                if validated_data:
+                    User.objects.filter(pk=instance.pk).update(**validated_data)
+                
+                # Update profile fields; this runs even without profile data
+                # so updated_at moves and cached /me/ responses are replaced
+                _update_profile(instance, profile_data)
+        except IntegrityError:
+            # Lost a race with another user taking the same email
+            raise serializers.ValidationError({
+                "email": "A user with this email already exists."
+            })
         
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
         return instance
 
 
@@ -150,19 +315,21 @@ class ChangePasswordSerializer(serializers.Serializer):
     
     def validate(self, attrs):
         """
-        Validate that new passwords match
+        Validate that new passwords match and differ from the old one before
+        checking the old password, which costs a full password hash
         """
+        if attrs['new_password'] == attrs['old_password']:
+            raise serializers.ValidationError({
+                "new_password": "New password must be different from the old password."
+            })
         if attrs['new_password'] != attrs['new_password2']:
             raise serializers.ValidationError({
                 "new_password": "New password fields didn't match."
             })
-        return attrs
-    
-    def validate_old_password(self, value):
-        """
-        Check that old password is correct
-        """
+        
         user = self.context['request'].user
-        if not user.check_password(value):
-            raise serializers.ValidationError("Old password is incorrect.")
-        return value
\ No newline at end of file
+        if not user.check_password(attrs['old_password']):
+            raise serializers.ValidationError({
+                "old_password": "Old password is incorrect."
+            })
+        return attrs
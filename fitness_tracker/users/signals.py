@@ -1,7 +1,8 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
 from .models import UserProfile
+from .cache import invalidate_current_user_cache
 
 
 @receiver(post_save, sender=User)
@@ -14,9 +15,29 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
+def save_user_profile(sender, instance, update_fields=None, **kwargs):
     """
     Automatically save UserProfile when User is saved
+
+    Partial saves (password changes, last_login updates) leave the
+    profile alone
+    """
+    if update_fields is None and hasattr(instance, 'profile'):
+        instance.profile.save()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """
+    Drop the cached /me/ response when a user changes
+    """
+    invalidate_current_user_cache(instance.pk)
+
+
+@receiver(post_save, sender=UserProfile)
+def invalidate_profile_cache(sender, instance, **kwargs):
+    """
+    Drop the cached /me/ response when a profile changes
     """
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
+    invalidate_current_user_cache(instance.user_id)
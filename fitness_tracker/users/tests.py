@@ -1,3 +1,370 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from datetime import date
+from decimal import Decimal
+from fitness_tracker.renderers import ORJSONRenderer
+from .models import UserProfile
+from .serializers import (
+    UserProfileSerializer,
+    UserRegistrationSerializer,
+    UserSerializer,
+    UserUpdateSerializer,
+    fetch_user_representation,
+    user_row,
+    user_to_representation
+)
+from .cache import current_user_cache_key
 
-# Create your tests here.
+
+class UserAPITest(APITestCase):
+    """
+    Test cases for user authentication and profile endpoints
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123',
+            first_name='Test'
+        )
+        UserProfile.objects.filter(user=cls.user).update(
+            height=180, weight=81, gender='M', date_of_birth=date(1990, 5, 17)
+        )
+    
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+    
+    def authenticate(self):
+        """Authenticate the client with a real JWT access token"""
+        access = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+    
+    def test_current_user(self):
+        """Test retrieving the current user with their profile"""
+        self.authenticate()
+        url = reverse('users:current-user')
+        
+        with self.assertNumQueries(1):  # user and profile joined
+            response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'testuser')
+        self.assertEqual(response.data['profile']['bmi'], 25.0)
+    
+    def test_current_user_unauthenticated(self):
+        """Test that unauthenticated users cannot access their profile"""
+        response = self.client.get(reverse('users:current-user'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_register(self):
+        """Test registering a new user with profile data"""
+        url = reverse('users:register')
+        data = {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'Str0ngPass!word',
+            'password2': 'Str0ngPass!word',
+            'profile': {'gender': 'F', 'height': '165.00'}
+        }
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['user']['username'], 'newuser')
+        # The response is built from the in-memory user and profile
+        self.assertFalse([
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'user_profiles' in query['sql']
+        ])
+        self.assertEqual(response.data['user']['profile']['gender'], 'F')
+        self.assertEqual(response.data['user']['profile']['height'], 165.0)
+        self.assertIn('access', response.data['tokens'])
+        self.assertEqual(User.objects.get(username='newuser').profile.gender, 'F')
+    
+    def test_register_duplicate_email(self):
+        """Test that registering with an existing email is rejected"""
+        url = reverse('users:register')
+        data = {
+            'username': 'another',
+            'email': 'test@example.com',
+            'password': 'Str0ngPass!word',
+            'password2': 'Str0ngPass!word'
+        }
+        
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.data)
+    
+    def test_register_duplicate_username_and_email(self):
+        """Test that taken username and email are reported from one query"""
+        url = reverse('users:register')
+        data = {
+            'username': 'testuser',
+            'email': 'test@example.com',
+            'password': 'Str0ngPass!word',
+            'password2': 'Str0ngPass!word'
+        }
+        
+        with self.assertNumQueries(1):
+            response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('username', response.data)
+        self.assertIn('email', response.data)
+    
+    def test_login(self):
+        """Test logging in returns tokens and user data"""
+        url = reverse('users:login')
+        response = self.client.post(url, {
+            'username': 'testuser',
+            'password': 'testpass123'
+        }, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.data)
+        self.assertEqual(response.data['user']['email'], 'test@example.com')
+    
+    def test_current_user_cached_until_changed(self):
+        """Test /me/ is served from cache and refreshed after updates"""
+        self.authenticate()
+        url = reverse('users:current-user')
+        
+        self.client.get(url)
+        user = User.objects.select_related('profile').get(pk=self.user.pk)
+        self.assertEqual(cache.get(current_user_cache_key(user))['first_name'], 'Test')
+        
+        self.client.patch(url, {'first_name': 'Patched'}, format='json')
+        self.assertEqual(self.client.get(url).data['first_name'], 'Patched')
+    
+    def test_current_user_cache_ignores_renders_from_before_update(self):
+        """Test a response rendered from a user loaded before an update is not served"""
+        self.authenticate()
+        url = reverse('users:current-user')
+        stale = User.objects.select_related('profile').get(pk=self.user.pk)
+        
+        self.client.patch(url, {'first_name': 'Patched'}, format='json')
+        # A GET that authenticated before the PATCH caches its render afterwards
+        cache.set(current_user_cache_key(stale), user_to_representation(user_row(stale)))
+        
+        self.assertEqual(self.client.get(url).data['first_name'], 'Patched')
+    
+    def test_logout(self):
+        """Test logging out blacklists the user's own refresh token only"""
+        self.authenticate()
+        url = reverse('users:logout')
+        refresh = str(RefreshToken.for_user(self.user))
+        other = User.objects.create_user(username='other', password='otherpass123')
+        
+        response = self.client.post(url, {'refresh': refresh}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_205_RESET_CONTENT)
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+        response = self.client.post(url, {'refresh': refresh}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        response = self.client.post(url, {
+            'refresh': str(RefreshToken.for_user(other))
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(url, {'refresh': 'not-a-token'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+    
+    def test_logout_with_rotated_refresh_token(self):
+        """Test a refresh token issued by rotation can be blacklisted on logout"""
+        login = self.client.post(reverse('users:login'), {
+            'username': 'testuser',
+            'password': 'testpass123'
+        }, format='json')
+        refreshed = self.client.post(reverse('users:token_refresh'), {
+            'refresh': login.data['refresh']
+        }, format='json')
+        rotated = refreshed.data['refresh']
+        
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refreshed.data['access']}")
+        response = self.client.post(reverse('users:logout'), {'refresh': rotated}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_205_RESET_CONTENT)
+        
+        response = self.client.post(reverse('users:token_refresh'), {'refresh': rotated}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_update_current_user(self):
+        """Test updating user and profile fields"""
+        self.authenticate()
+        url = reverse('users:current-user')
+        response = self.client.patch(url, {
+            'first_name': 'Updated',
+            'profile': {'weight': '75.50'}
+        }, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['first_name'], 'Updated')
+        self.assertEqual(response.data['profile']['weight'], 75.5)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Updated')
+        self.assertEqual(self.user.profile.weight, 75.5)
+    
+    def test_update_current_user_duplicate_email(self):
+        """Test that taking another user's email on update is rejected"""
+        User.objects.create_user(username='other', email='other@example.com', password='otherpass123')
+        self.authenticate()
+        url = reverse('users:current-user')
+        
+        response = self.client.patch(url, {'email': 'other@example.com'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.data)
+        
+        response = self.client.patch(url, {'email': 'test@example.com'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_update_rejects_non_finite_measurements(self):
+        """Test that NaN and infinite height/weight are rejected"""
+        for value in ('NaN', 'Infinity', '-Infinity'):
+            serializer = UserUpdateSerializer(
+                self.user, data={'profile': {'height': value, 'weight': value}}, partial=True
+            )
+            self.assertFalse(serializer.is_valid(), value)
+            self.assertIn('height', serializer.errors['profile'])
+            self.assertIn('weight', serializer.errors['profile'])
+    
+    def test_change_password(self):
+        """Test changing the password, rejecting an unchanged one up front"""
+        self.authenticate()
+        url = reverse('users:change-password')
+        
+        response = self.client.post(url, {
+            'old_password': 'testpass123',
+            'new_password': 'testpass123',
+            'new_password2': 'testpass123'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('new_password', response.data)
+        
+        response = self.client.post(url, {
+            'old_password': 'wrongpass',
+            'new_password': 'N3wStr0ngPass!',
+            'new_password2': 'N3wStr0ngPass!'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('old_password', response.data)
+        
+        response = self.client.post(url, {
+            'old_password': 'testpass123',
+            'new_password': 'N3wStr0ngPass!',
+            'new_password2': 'N3wStr0ngPass!'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('N3wStr0ngPass!'))
+    
+    def test_serializer_fields_cached_per_class(self):
+        """Test serializer instances share built fields but bind their own copies"""
+        first = UserRegistrationSerializer(data={})
+        second = UserRegistrationSerializer(data={'username': 'testuser'})
+        
+        self.assertEqual(list(first.fields), list(second.fields))
+        self.assertIsNot(first.fields['username'], second.fields['username'])
+        self.assertIs(first.fields['username'].parent, first)
+        self.assertIs(second.fields['profile'].parent, second)
+        self.assertFalse(first.is_valid())
+        self.assertFalse(second.is_valid())
+        self.assertIn('username', first.errors)
+        self.assertNotIn('username', second.errors)
+    
+    def test_empty_profile_representation(self):
+        """Test the empty-profile shortcut matches full field serialization"""
+        user = User.objects.create_user(username='fresh', password='freshpass123')
+        user = User.objects.select_related('profile').get(pk=user.pk)
+        serializer = UserProfileSerializer(user.profile)
+        expected = super(UserProfileSerializer, serializer).to_representation(user.profile)
+        
+        self.assertEqual(serializer.data, expected)
+        self.assertEqual(user_to_representation(user_row(user))['profile'], expected)
+        self.assertEqual(fetch_user_representation(pk=user.pk)['profile'], expected)
+    
+    def test_profile_str_does_not_query(self):
+        """Test str() of a profile uses the username only when already loaded"""
+        profile = UserProfile.objects.get(user=self.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(profile), f'Profile<{self.user.pk}>')
+        
+        profile = UserProfile.objects.select_related('user').get(user=self.user)
+        self.assertEqual(str(profile), "testuser's Profile")
+    
+    def test_fast_representation_matches_serializer(self):
+        """Test the values()-based user representation matches UserSerializer"""
+        user = User.objects.select_related('profile').get(pk=self.user.pk)
+        expected = UserSerializer(user).data
+        
+        self.assertEqual(user_to_representation(user_row(user)), expected)
+        self.assertEqual(fetch_user_representation(pk=self.user.pk), expected)
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class UserProfileAdminTest(TestCase):
+    """
+    Test cases for UserProfile admin
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        for i in range(3):
+            User.objects.create_user(username=f'user{i}', password='testpass123')
+    
+    def test_changelist_query_count_constant(self):
+        """Test the changelist does not query each profile's user"""
+        self.client.force_login(self.admin_user)
+        url = reverse('admin:users_userprofile_changelist')
+        
+        with self.assertNumQueries(5):  # session, user, count, total count, page
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'user2')
+        
+        changelist = response.context['cl']
+        profile = changelist.result_list[0]
+        self.assertEqual(profile.get_deferred_fields(), {'bio', 'profile_picture', 'updated_at'})
+        # Actions get their queryset from get_queryset(), which is not trimmed
+        profile = changelist.get_queryset(response.wsgi_request)[0]
+        self.assertEqual(profile.get_deferred_fields(), set())
+
+
+class ORJSONRendererTest(TestCase):
+    """
+    Test cases for the orjson-backed JSON renderer
+    """
+    
+    def test_matches_json_renderer(self):
+        """Test compact output is byte-identical to DRF's JSONRenderer"""
+        data = {
+            'text': 'line\u2028para\u2029 caf\u00e9',
+            'decimal': Decimal('1.50'),
+            'items': [1, 2.5, None, True],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+    
+    def test_renders_non_str_keys(self):
+        """Test dicts with non-str keys, as in ListField errors, render like json.dumps"""
+        data = {'items': {0: ['A valid integer is required.'], 2: ['Invalid.']}}
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+    
+    def test_rejects_non_finite_numbers(self):
+        """Test NaN and infinity raise instead of rendering as null"""
+        for value in (float('nan'), float('inf'), Decimal('NaN')):
+            with self.assertRaises(ValueError):
+                ORJSONRenderer().render({'profile': {'bmi': value}})
@@ -2,11 +2,23 @@ from django.shortcuts import render
 from rest_framework import status, generics, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from .authentication import ProfileJWTAuthentication
+from .cache import (
+    CURRENT_USER_CACHE_TIMEOUT,
+    current_user_cache_key,
+    invalidate_current_user_cache
+)
 from .serializers import (
     UserSerializer,
+    fetch_user_representation,
+    user_row,
+    user_to_representation,
     UserRegistrationSerializer,
     UserUpdateSerializer,
     ChangePasswordSerializer
@@ -27,15 +39,17 @@ class UserRegistrationView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         
-        # Generate tokens for the new user
+        # Generate tokens for the new user; access_token builds a new token
+        # on every access, so derive it once
         refresh = RefreshToken.for_user(user)
+        access = refresh.access_token
         
         return Response({
-            'user': UserSerializer(user).data,
+            'user': user_to_representation(user_row(user)),
             'message': 'User registered successfully',
             'tokens': {
                 'refresh': str(refresh),
-                'access': str(refresh.access_token),
+                'access': str(access),
             }
         }, status=status.HTTP_201_CREATED)
 
@@ -54,10 +68,9 @@ class UserLoginView(TokenObtainPairView):
         if response.status_code == 200:
             # Get user information
             username = request.data.get('username')
-            user = User.objects.get(username=username)
             
             # Add user data to response
-            response.data['user'] = UserSerializer(user).data
+            response.data['user'] = fetch_user_representation(username=username)
             response.data['message'] = 'Login successful'
         
         return response
@@ -72,26 +85,29 @@ class UserLogoutView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def post(self, request):
+        refresh_token = request.data.get("refresh")
+        if not refresh_token:
+            return Response(
+                {"error": "Refresh token is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         try:
-            refresh_token = request.data.get("refresh")
-            if not refresh_token:
-                return Response(
-                    {"error": "Refresh token is required"},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
             token = RefreshToken(refresh_token)
+            # Only let users end their own sessions
+            if token.get(jwt_settings.USER_ID_CLAIM) != request.user.pk:
+                raise TokenError("Token does not belong to the current user")
             token.blacklist()
-            
-            return Response(
-                {"message": "Logout successful"},
-                status=status.HTTP_205_RESET_CONTENT
-            )
-        except Exception as e:
+        except TokenError as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        return Response(
+            {"message": "Logout successful"},
+            status=status.HTTP_205_RESET_CONTENT
+        )
 
 
 class CurrentUserView(generics.RetrieveUpdateDestroyAPIView):
@@ -101,12 +117,29 @@ class CurrentUserView(generics.RetrieveUpdateDestroyAPIView):
     PUT/PATCH /api/users/me/ - Update current user
     DELETE /api/users/me/ - Delete current user
     """
+    queryset = User.objects.select_related('profile')
     serializer_class = UserUpdateSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # Authenticate with the profile joined so serializing it needs no extra query
+    authentication_classes = [ProfileJWTAuthentication]
     
     def get_object(self):
         return self.request.user
     
+    def retrieve(self, request, *args, **kwargs):
+        user = self.get_object()
+        data = cache.get_or_set(
+            current_user_cache_key(user),
+            lambda: user_to_representation(user_row(user)),
+            CURRENT_USER_CACHE_TIMEOUT
+        )
+        return Response(data)
+    
+    def perform_update(self, serializer):
+        # The update writes through querysets, which send no post_save
+        serializer.save()
+        invalidate_current_user_cache(serializer.instance.pk)
+    
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return UserSerializer
@@ -138,7 +171,7 @@ class ChangePasswordView(APIView):
             # Set new password
             user = request.user
             user.set_password(serializer.validated_data['new_password'])
-            user.save()
+            user.save(update_fields=['password'])
             
             return Response(
                 {"message": "Password changed successfully"},